@@ -4,141 +4,197 @@ API routes wiring the FastAPI application.
 
 from __future__ import annotations
 
-import copy
+import codecs
 import csv
 import io
-from collections import OrderedDict
-from threading import Lock
-from time import time
-from typing import Dict, List, Optional, Tuple
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 
+from app.core.cache import TTLCache
 from app.core.config import DEFAULT_CATEGORIES, get_settings
 from app.schemas.search import Place, SearchRequest, SearchResponse
 from app.services.geocode import GeocodingError, geocode_location
-from app.services.overpass import OverpassError, fetch_california_places, fetch_places, get_mock_places
+from app.services.overpass import (
+    OverpassError,
+    fetch_california_places,
+    fetch_california_places_with_emails,
+    fetch_places,
+    fixed_point,
+    get_mock_places,
+)
 
 router = APIRouter(prefix="/api")
 
-CacheKey = Tuple[float, float, int, Tuple[str, ...], bool]
-CacheEntry = Dict[str, object]
-
-_SEARCH_CACHE: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
-_SEARCH_CACHE_LOCK = Lock()
+CacheKey = Tuple[int, int, int, Tuple[str, ...], bool]
+QueryKey = Tuple[str, int, Tuple[str, ...], bool]
+
+_SEARCH_CACHE: "TTLCache[CacheKey, SearchResponse]" = TTLCache(name="search")
+_QUERY_CACHE: "TTLCache[QueryKey, SearchResponse]" = TTLCache(name="query")
+
+CSV_FIELDNAMES = [
+    "category",
+    "name",
+    "phone",
+    "email",
+    "website",
+    "address",
+    "lat",
+    "lon",
+    "osm_id",
+    "source_tags",
+]
+_CACHE_COORD_SCALE = 100_000  # Cache keys quantise coordinates to 5 decimal places (~1 m).
+_CSV_BATCH_ROWS = 500
+_UTF8_WRITER = codecs.getwriter("utf-8")
+
+# Row extractors in CSV column order; both run in C without building per-row dicts.
+_place_row = attrgetter(*CSV_FIELDNAMES)
+_record_row = itemgetter(*CSV_FIELDNAMES)
 
 
 def _make_cache_key(lat: float, lon: float, radius_m: int, categories: List[str], with_email: bool) -> CacheKey:
     """
     Normalise search parameters into a hashable cache key.
+
+    Coordinates are quantised to 5 decimal places (~1 m) as integers.
     """
     normalized_categories = tuple(sorted(categories))
-    return (round(lat, 5), round(lon, 5), radius_m, normalized_categories, with_email)
+    return (
+        fixed_point(lat, _CACHE_COORD_SCALE),
+        fixed_point(lon, _CACHE_COORD_SCALE),
+        radius_m,
+        normalized_categories,
+        with_email,
+    )
 
 
-def _get_cached_response(key: CacheKey) -> Optional[Dict[str, object]]:
+def _make_query_key(location: str, radius_m: int, categories: List[str], with_email: bool) -> QueryKey:
     """
-    Return a cached result if it exists and has not expired.
+    Normalise the raw search input into a hashable key that needs no geocoding.
     """
-    now = time()
-    with _SEARCH_CACHE_LOCK:
-        entry = _SEARCH_CACHE.get(key)
-        if not entry:
-            return None
-        expires_at = entry.get("expires_at")
-        if isinstance(expires_at, (int, float)) and expires_at < now:
-            del _SEARCH_CACHE[key]
-            return None
-        _SEARCH_CACHE.move_to_end(key)
-        return {
-            "label": entry["label"],
-            "results": copy.deepcopy(entry["results"]),
-        }
+    return (location.strip().casefold(), radius_m, tuple(sorted(categories)), with_email)
 
 
-def _store_cached_response(
-    key: CacheKey,
-    label: str,
-    results: List[Dict],
-    ttl_seconds: int,
-    max_entries: int,
-) -> None:
+def _reuse_cached_response(cached: SearchResponse, radius_km: float, categories: List[str]) -> SearchResponse:
     """
-    Store a search response in the LRU cache subject to TTL and size limits.
+    Return a cached response, echoing the caller's radius and category order.
     """
-    if ttl_seconds <= 0:
-        return
-
-    expires_at = time() + ttl_seconds
-    payload: CacheEntry = {
-        "label": label,
-        "results": copy.deepcopy(results),
-        "expires_at": expires_at,
-    }
-
-    with _SEARCH_CACHE_LOCK:
-        _SEARCH_CACHE[key] = payload
-        _SEARCH_CACHE.move_to_end(key)
-        while len(_SEARCH_CACHE) > max_entries:
-            _SEARCH_CACHE.popitem(last=False)
+    if cached.radius_km == radius_km and cached.categories == categories:
+        return cached
+    return cached.model_copy(update={"radius_km": radius_km, "categories": categories})
 
 
 def _perform_search(request: SearchRequest) -> SearchResponse:
     """
     Core search logic shared by search and export endpoints.
+
+    Repeated input is answered from `_QUERY_CACHE` without geocoding. Differently
+    spelled locations that geocode to the same point still share `_SEARCH_CACHE`.
     """
     settings = get_settings()
 
+    radius_m = int(request.radius_km * 1000)
+    categories: List[str] = request.categories or list(DEFAULT_CATEGORIES.keys())
+    query_key = _make_query_key(request.location, radius_m, categories, request.with_email_enrichment)
+
+    cached = _QUERY_CACHE.get(query_key)
+    if cached is not None:
+        return _reuse_cached_response(cached, request.radius_km, categories)
+
     try:
         lat, lon, label = geocode_location(request.location)
     except GeocodingError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    radius_m = int(request.radius_km * 1000)
-    categories: List[str] = request.categories or list(DEFAULT_CATEGORIES.keys())
     cache_key = _make_cache_key(lat, lon, radius_m, categories, request.with_email_enrichment)
 
-    cached = _get_cached_response(cache_key)
-    if cached:
-        cached_label = cached.get("label")
-        if isinstance(cached_label, str):
-            label = cached_label
-        results = cached["results"]  # type: ignore[assignment]
-    else:
-        used_mock_results = False
-        try:
-            results = fetch_places(
-                lat=lat,
-                lon=lon,
-                radius_m=radius_m,
-                categories=categories,
-                enable_email_discovery=request.with_email_enrichment,
-            )
-        except OverpassError as exc:
-            results = get_mock_places(categories)
-            if not results:
-                raise HTTPException(
-                    status_code=503,
-                    detail="Overpass API is currently unavailable. Please retry shortly.",
-                ) from exc
-            used_mock_results = True
-        if not used_mock_results:
-            _store_cached_response(
-                cache_key,
-                label,
-                results,
-                settings.search_cache_ttl_seconds,
-                settings.search_cache_max_entries,
-            )
-
-    place_models = [Place(**place) for place in results]
-
-    return SearchResponse(
+    cached = _SEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        _QUERY_CACHE.set(query_key, cached, settings.search_cache_ttl_seconds, settings.search_cache_max_entries)
+        return _reuse_cached_response(cached, request.radius_km, categories)
+
+    used_mock_results = False
+    try:
+        results = fetch_places(
+            lat=lat,
+            lon=lon,
+            radius_m=radius_m,
+            categories=categories,
+            enable_email_discovery=request.with_email_enrichment,
+        )
+    except OverpassError as exc:
+        results = get_mock_places(categories)
+        if not results:
+            raise HTTPException(
+                status_code=503,
+                detail="Overpass API is currently unavailable. Please retry shortly.",
+            ) from exc
+        used_mock_results = True
+
+    response = SearchResponse(
         location_label=label,
         radius_km=request.radius_km,
         categories=categories,
-        results=place_models,
+        results=[Place(**place) for place in results],
+    )
+
+    if not used_mock_results:
+        _SEARCH_CACHE.set(
+            cache_key,
+            response,
+            settings.search_cache_ttl_seconds,
+            settings.search_cache_max_entries,
+        )
+        _QUERY_CACHE.set(query_key, response, settings.search_cache_ttl_seconds, settings.search_cache_max_entries)
+
+    return response
+
+
+def _iter_csv(rows: Iterable[Sequence[object]]) -> Iterator[bytes]:
+    """
+    Serialise row tuples to UTF-8 CSV in small batches so exports stream to the client.
+
+    Rows are encoded as they are written into a reusable byte buffer, so no separate
+    encode pass copies each chunk.
+    """
+    buffer = io.BytesIO()
+    writer = csv.writer(_UTF8_WRITER(buffer))
+
+    writer.writerow(CSV_FIELDNAMES)
+    yield buffer.getvalue()
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, _CSV_BATCH_ROWS))
+        if not batch:
+            return
+        buffer.seek(0)
+        buffer.truncate(0)
+        writer.writerows(batch)
+        yield buffer.getvalue()
+
+
+def _start_stream(records: Iterator[Dict]) -> Iterator[Dict]:
+    """
+    Pull the first record eagerly so upstream failures surface before the response starts.
+    """
+    first = next(records, None)
+    if first is None:
+        return iter(())
+    return chain((first,), records)
+
+
+def _csv_response(rows: Iterable[Sequence[object]], filename: str) -> StreamingResponse:
+    """
+    Wrap a row iterator in a streaming CSV download.
+    """
+    return StreamingResponse(
+        _iter_csv(rows),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
@@ -159,83 +215,30 @@ def search_places(request: SearchRequest) -> SearchResponse:
 
 
 @router.post("/export")
-def export_places(request: SearchRequest) -> Response:
+def export_places(request: SearchRequest) -> StreamingResponse:
     """
     Return CSV for the same input parameters as `/search`.
     """
-    try:
-        response = _perform_search(request)
-    except HTTPException as exc:
-        if exc.status_code == 503:
-            raise
-        raise exc
-
-    buffer = io.StringIO()
-    writer = csv.DictWriter(
-        buffer,
-        fieldnames=[
-            "category",
-            "name",
-            "phone",
-            "email",
-            "website",
-            "address",
-            "lat",
-            "lon",
-            "osm_id",
-            "source_tags",
-        ],
-    )
-    writer.writeheader()
-    for place in response.results:
-        writer.writerow(place.model_dump())
-
+    response = _perform_search(request)
     filename = f"findyourplace_{response.location_label.replace(' ', '_')}.csv"
-
-    csv_bytes = buffer.getvalue().encode("utf-8")
-
-    return Response(
-        content=csv_bytes,
-        media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    return _csv_response(map(_place_row, response.results), filename)
 
 
 @router.get("/california/export")
-def export_california_places(with_email_enrichment: bool = False) -> Response:
+def export_california_places(with_email_enrichment: bool = False) -> StreamingResponse:
     """
     Generate a statewide CSV export for California using the standalone batch logic.
     """
+    records: Iterable[Mapping[str, Any]]
     try:
-        records = fetch_california_places(enable_email_discovery=with_email_enrichment)
+        # Enrichment needs the full result set; only give up streaming when it will actually run.
+        if with_email_enrichment and get_settings().enable_website_email_discovery:
+            records = fetch_california_places_with_emails()
+        else:
+            records = _start_stream(fetch_california_places())
     except OverpassError as exc:
         records = get_mock_places()
         if not records:
             raise HTTPException(status_code=503, detail="Overpass API is currently unavailable. Please retry shortly.") from exc
 
-    buffer = io.StringIO()
-    writer = csv.DictWriter(
-        buffer,
-        fieldnames=[
-            "category",
-            "name",
-            "phone",
-            "email",
-            "website",
-            "address",
-            "lat",
-            "lon",
-            "osm_id",
-            "source_tags",
-        ],
-    )
-    writer.writeheader()
-    for record in records:
-        writer.writerow(record)
-
-    csv_bytes = buffer.getvalue().encode("utf-8")
-    return Response(
-        content=csv_bytes,
-        media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": 'attachment; filename="findyourplace_california.csv"'},
-    )
+    return _csv_response(map(_record_row, records), "findyourplace_california.csv")
@@ -0,0 +1,141 @@
+"""
+In-memory LRU cache with per-entry expiry shared by the API and service layers.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock, get_ident
+from time import time
+from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+logger = logging.getLogger(__name__)
+
+_NAMED_CACHES: Dict[str, "TTLCache"] = {}
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Thread-safe LRU cache whose entries expire after a per-store TTL.
+
+    Lookups run without the lock (dict reads are atomic under the GIL). Recency is
+    bumped only when the lock is free, so hits never wait behind a writer; the LRU
+    order is approximate under contention. Cached values are shared between callers
+    and must not be mutated.
+
+    Passing a `name` registers the cache for on-disk snapshots via
+    `save_snapshots` / `load_snapshots`.
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        self._entries: "OrderedDict[K, Tuple[V, float]]" = OrderedDict()
+        self._lock = Lock()
+        if name:
+            _NAMED_CACHES[name] = self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Return the cached value if it exists and has not expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at < time():
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            return None
+
+        if self._lock.acquire(blocking=False):
+            try:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+            finally:
+                self._lock.release()
+        return value
+
+    def set(self, key: K, value: V, ttl_seconds: int, max_entries: int) -> None:
+        """
+        Store a value subject to TTL and size limits, evicting least recently used entries.
+        """
+        if ttl_seconds <= 0:
+            return
+
+        entry = (value, time() + ttl_seconds)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drop every cached entry.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def dump(self, path: Path) -> None:
+        """
+        Pickle unexpired entries, oldest first, writing atomically to `path`.
+        """
+        now = time()
+        with self._lock:
+            entries = [(key, entry) for key, entry in self._entries.items() if entry[1] >= now]
+        # Unique per process and thread: uvicorn workers all dump on shutdown at once.
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{get_ident()}.tmp")
+        with tmp_path.open("wb") as handle:
+            pickle.dump(entries, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def load(self, path: Path) -> None:
+        """
+        Restore unexpired entries from a snapshot written by `dump`.
+        """
+        with path.open("rb") as handle:
+            entries = pickle.load(handle)
+        now = time()
+        with self._lock:
+            for key, entry in entries:
+                if entry[1] >= now:
+                    self._entries[key] = entry
+                    self._entries.move_to_end(key)
+
+
+def save_snapshots(directory: str) -> None:
+    """
+    Write every named cache to `<directory>/<name>.pickle`.
+    """
+    target = Path(directory)
+    target.mkdir(parents=True, exist_ok=True)
+    for name, cache in _NAMED_CACHES.items():
+        try:
+            cache.dump(target / f"{name}.pickle")
+        except Exception:  # noqa: BLE001
+            logger.warning("Could not save %s cache snapshot", name, exc_info=True)
+
+
+def load_snapshots(directory: str) -> None:
+    """
+    Warm every named cache from snapshots in `directory`, skipping missing or unreadable files.
+    """
+    for name, cache in _NAMED_CACHES.items():
+        path = Path(directory) / f"{name}.pickle"
+        if not path.exists():
+            continue
+        try:
+            cache.load(path)
+        except Exception:  # noqa: BLE001
+            logger.warning("Could not load %s cache snapshot", name, exc_info=True)
@@ -24,10 +24,36 @@ class Settings(BaseSettings):
     crawl_sleep_seconds: float = 1.0
     enable_website_email_discovery: bool = False
     overpass_retry_attempts: int = 3
+    overpass_cache_dir: Optional[str] = Field(
+        None,
+        description="Directory for gzip-compressed Overpass responses keyed by query hash; unset disables it.",
+    )
+    overpass_cache_ttl_seconds: int = Field(
+        24 * 60 * 60,
+        ge=0,
+        description="Maximum age of an on-disk Overpass response before it is fetched again.",
+    )
+    overpass_hedge_after_seconds: Optional[float] = Field(
+        None,
+        gt=0,
+        description="Start the next Overpass mirror in parallel after this many seconds without a reply; unset tries mirrors one at a time.",
+    )
     user_agent: str = "FindYourPlace/1.0 (+https://example.com)"
     max_parallel_category_requests: int = Field(
         4,
-        description="Upper bound for parallel Overpass category calls.",
+        ge=1,
+        description="Upper bound for parallel Overpass category calls per search.",
+    )
+    category_pool_size: int = Field(
+        16,
+        ge=1,
+        description="Threads shared by all concurrent searches for Overpass category calls; "
+        "roughly max_parallel_category_requests times the expected concurrent searches.",
+    )
+    email_discovery_concurrency: int = Field(
+        8,
+        ge=1,
+        description="Upper bound for websites crawled in parallel during email enrichment.",
     )
     distance_tolerance_factor: float = Field(
         1.05,
@@ -43,6 +69,20 @@ class Settings(BaseSettings):
         ge=1,
         description="Maximum number of cached search responses to retain in memory.",
     )
+    geocode_cache_ttl_seconds: int = Field(
+        30 * 24 * 60 * 60,
+        ge=0,
+        description="TTL for in-memory geocoding results; coordinates for a query rarely change.",
+    )
+    geocode_cache_max_entries: int = Field(
+        2048,
+        ge=1,
+        description="Maximum number of geocoded locations to retain in memory.",
+    )
+    cache_snapshot_dir: Optional[str] = Field(
+        None,
+        description="Directory where geocode and search caches are saved on shutdown and restored on startup.",
+    )
     mock_places_path: Optional[str] = Field(
         default=str((Path(__file__).resolve().parent.parent / "data" / "sample_places.json")),
         description="Optional path to static places data used when Overpass is unavailable.",
@@ -58,12 +98,13 @@ def get_settings() -> Settings:
     return Settings()
 
 
+# Values are tuples so the Overpass queries pre-rendered from them cannot drift.
 DEFAULT_CATEGORIES = {
-    "school": {"key": "amenity", "values": ["school"]},
-    "college": {"key": "amenity", "values": ["college", "university"]},
-    "hospital": {"key": "amenity", "values": ["hospital", "clinic"]},
+    "school": {"key": "amenity", "values": ("school",)},
+    "college": {"key": "amenity", "values": ("college", "university")},
+    "hospital": {"key": "amenity", "values": ("hospital", "clinic")},
     "hotel": {
         "key": "tourism",
-        "values": ["hotel", "motel", "hostel", "guest_house"],
+        "values": ("hotel", "motel", "hostel", "guest_house"),
     },
 }
@@ -4,12 +4,31 @@ FastAPI application entrypoint.
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import router as api_router
+from app.core.cache import load_snapshots, save_snapshots
+from app.core.config import get_settings
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """
+    Warm in-memory caches from disk on startup and persist them on shutdown.
+    """
+    snapshot_dir = get_settings().cache_snapshot_dir
+    if snapshot_dir:
+        load_snapshots(snapshot_dir)
+    yield
+    if snapshot_dir:
+        save_snapshots(snapshot_dir)
+
 
-app = FastAPI(title="FindYourPlace API", version="1.0.0")
+app = FastAPI(title="FindYourPlace API", version="1.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
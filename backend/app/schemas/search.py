@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from app.core.config import DEFAULT_CATEGORIES
 
@@ -29,6 +29,8 @@ class SearchRequest(BaseModel):
 
 
 class Place(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     osm_id: str
     category: str
     name: Optional[str]
@@ -4,18 +4,20 @@ Geocoding helpers backed by OpenStreetMap's Nominatim service.
 
 from __future__ import annotations
 
-from typing import Dict, Optional, Tuple
+from typing import Optional, Tuple
 
-import requests
+import orjson
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
+from app.services.http import get_session
 
 
 class GeocodingError(RuntimeError):
     """Raised when the geocoder cannot find a location."""
 
 
-_GEOCODE_CACHE: Dict[str, Tuple[float, float, str]] = {}
+_GEOCODE_CACHE: "TTLCache[str, Tuple[float, float, str]]" = TTLCache(name="geocode")
 
 
 def geocode_location(query: str) -> Tuple[float, float, str]:
@@ -26,17 +28,16 @@ def geocode_location(query: str) -> Tuple[float, float, str]:
     if not cleaned_query:
         raise GeocodingError("Location cannot be empty.")
 
-    cache_key = cleaned_query.lower()
+    cache_key = cleaned_query.casefold()
     cached = _GEOCODE_CACHE.get(cache_key)
-    if cached:
+    if cached is not None:
         return cached
 
     settings = get_settings()
     params = {"q": cleaned_query, "format": "json", "limit": 1}
-    headers = {"User-Agent": settings.user_agent}
-    resp = requests.get("https://nominatim.openstreetmap.org/search", params=params, headers=headers, timeout=settings.http_timeout)
+    resp = get_session().get("https://nominatim.openstreetmap.org/search", params=params, timeout=settings.http_timeout)
     resp.raise_for_status()
-    payload = resp.json()
+    payload = orjson.loads(resp.content)
     if not payload:
         raise GeocodingError(f"Could not geocode location: {cleaned_query}")
     item = payload[0]
@@ -44,5 +45,10 @@ def geocode_location(query: str) -> Tuple[float, float, str]:
     lon = float(item["lon"])
     display_name: Optional[str] = item.get("display_name")
     result = (lat, lon, display_name or cleaned_query)
-    _GEOCODE_CACHE[cache_key] = result
+    _GEOCODE_CACHE.set(
+        cache_key,
+        result,
+        settings.geocode_cache_ttl_seconds,
+        settings.geocode_cache_max_entries,
+    )
     return result
@@ -0,0 +1,77 @@
+"""
+Shared HTTP session for outbound calls to Nominatim, Overpass, and crawled websites.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.core.config import get_settings
+
+# Per-host connection pools; sized for the category and email-discovery thread pools.
+_POOL_CONNECTIONS = 16
+_POOL_MAXSIZE = 64
+
+
+def _overpass_retry(attempts: int) -> Retry:
+    """
+    Retry policy for a single Overpass mirror, honouring `Retry-After` on 429s.
+    """
+    return Retry(
+        total=max(0, attempts - 1),
+        backoff_factor=1,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def _pooled_session() -> requests.Session:
+    """
+    Build a session with the shared User-Agent and a plain pooled adapter for every host.
+    """
+    settings = get_settings()
+    session = requests.Session()
+    session.headers.update({"User-Agent": settings.user_agent})
+
+    pooled = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE)
+    session.mount("http://", pooled)
+    session.mount("https://", pooled)
+    return session
+
+
+@lru_cache
+def get_session() -> requests.Session:
+    """
+    Return the process-wide session so keep-alive connections are reused across calls.
+
+    Overpass mirrors get an adapter that retries transient failures; other hosts
+    get a plain pooled adapter.
+    """
+    settings = get_settings()
+    session = _pooled_session()
+
+    overpass = HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=_overpass_retry(settings.overpass_retry_attempts),
+    )
+    for url in settings.overpass_urls:
+        session.mount(url, overpass)
+    return session
+
+
+@lru_cache
+def get_hedge_session() -> requests.Session:
+    """
+    Return the session for hedged Overpass attempts, which skip transport retries.
+
+    Racing the next mirror takes the place of retrying a slow one, so an attempt
+    that loses the race ends after a single request.
+    """
+    return _pooled_session()
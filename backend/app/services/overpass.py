@@ -4,95 +4,356 @@ Utilities for querying the Overpass API and normalising results.
 
 from __future__ import annotations
 
-import json
+import atexit
+import gzip
+import hashlib
+import logging
+import os
 import re
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from math import atan2, cos, radians, sin, sqrt
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from math import asin, cos, degrees, pi, radians, sin
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from threading import Lock, get_ident
+from types import MappingProxyType
+from typing import Any, Deque, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Match, Optional, Set, Tuple
+from urllib.parse import urljoin, urlparse
 
-import requests
+import orjson
 
 from app.core.config import DEFAULT_CATEGORIES, get_settings
+from app.services.http import get_hedge_session, get_session
 
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_M = 6371000  # Mean Earth radius in metres.
 EMAIL_REGEX = re.compile(r"[A-Z0-9._%+\-]+@[A-Z0-9.\-]+\.[A-Z]{2,}", re.IGNORECASE)
-_MOCK_CACHE: Optional[List[Dict]] = None
+_EMAIL_LOCAL_MAX = 64  # RFC 5321 limits for the local part and the domain.
+_EMAIL_DOMAIN_MAX = 255
+_EMAIL_MATCH_MAX = _EMAIL_LOCAL_MAX + _EMAIL_DOMAIN_MAX + 1
+_EMAIL_DOMAIN_AT = re.compile(r"@[A-Z0-9.\-]+\.[A-Z]{2,}", re.IGNORECASE)  # The domain half of EMAIL_REGEX.
+_OPEN_DOMAIN_TAIL = re.compile(r"[A-Z0-9.\-]*\Z", re.IGNORECASE)
+_MAX_PAGE_CHARS = 512 * 1024  # Contact details sit near the top; skip the rest of huge pages.
+_CONTACT_PATHS = ("/contact", "/contact-us")
+_PLACEHOLDER_EMAIL_MARKERS = ("example.com", "email@", "your@", "info@example")
+# Website tags often point at social profiles or documents; neither yields a scrapeable address.
+_NO_EMAIL_HOSTS = frozenset(
+    {"facebook.com", "fb.com", "instagram.com", "twitter.com", "x.com", "linkedin.com", "youtube.com", "tiktok.com"}
+)
+_NON_HTML_SUFFIXES = (".pdf", ".jpg", ".jpeg", ".png", ".gif", ".doc", ".docx")
+COORD_SCALE = 1_000_000  # Fixed-point scale for dedupe keys: 6 decimal places, ~0.1 m.
+_MOCK_CACHE: Optional[Tuple[Mapping[str, Any], ...]] = None
+_MOCK_LOCK = Lock()
+# OSM relation for the California state boundary; Overpass area ids are relation ids offset by 3.6e9.
+CALIFORNIA_RELATION_ID = 165475
+_CALIFORNIA_AREA_ID = 3_600_000_000 + CALIFORNIA_RELATION_ID
+_HOST_NEXT_SLOT: Dict[str, float] = {}  # Earliest monotonic time each crawled host may be hit again.
+_HOST_SLOT_LOCK = Lock()
+_HOST_SLOT_PRUNE_AT = 4096
 
 
 class OverpassError(RuntimeError):
     """Raised when the Overpass API cannot satisfy a request."""
 
 
-def _value_regex(values: Iterable[str]) -> str:
-    return "^(" + "|".join([re.escape(v) for v in values]) + ")$"
+def _ql_string(value: str) -> str:
+    """
+    Quote a literal for use inside an Overpass QL tag filter.
+    """
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _union_statements(tag_key: str, tag_values: Iterable[str], scope: str) -> str:
+    """
+    Overpass QL union members matching any of `tag_values` exactly within `scope`.
+
+    Exact `key=value` filters let Overpass answer from its tag index, whereas a
+    `~` regex filter has to be evaluated against every candidate's value.
+    """
+    key = _ql_string(tag_key)
+    return "\n".join(
+        f"      {element}[{key}={_ql_string(value)}]{scope};"
+        for value in tag_values
+        for element in ("node", "way", "relation")
+    )
 
 
-def build_area_query(lat: float, lon: float, radius_m: int, tag_key: str, tag_values: List[str]) -> str:
+def _area_query_template(tag_key: str, tag_values: Tuple[str, ...]) -> str:
     """
-    Build an Overpass QL query scoped to a circular area.
+    Overpass QL for a circular area, leaving `{radius_m}`, `{lat}` and `{lon}` as placeholders.
     """
-    value_regex = _value_regex(tag_values)
+    def _escape_braces(text: str) -> str:
+        return text.replace("{", "{{").replace("}", "}}")
+
+    statements = _union_statements(
+        _escape_braces(tag_key),
+        [_escape_braces(value) for value in tag_values],
+        "(around:{radius_m},{lat},{lon})",
+    )
     return f"""
     [out:json][timeout:900][maxsize:2000000000];
 
     (
-      node["{tag_key}"~"{value_regex}"](around:{radius_m},{lat},{lon});
-      way ["{tag_key}"~"{value_regex}"](around:{radius_m},{lat},{lon});
-      relation ["{tag_key}"~"{value_regex}"](around:{radius_m},{lat},{lon});
+{statements}
     );
 
     out tags center qt;
     """
 
 
-def build_california_query(tag_key: str, tag_values: List[str]) -> str:
+def _california_query(statements: str) -> str:
     """
-    Build an Overpass QL query covering the California administrative boundary.
+    Overpass QL running the union `statements` inside the California administrative boundary.
+
+    The area is addressed by id, so Overpass does not have to look the boundary
+    relation up by its tags first.
     """
-    value_regex = _value_regex(tag_values)
     return f"""
     [out:json][timeout:900][maxsize:2000000000];
 
-    rel["name"="California"]["boundary"="administrative"]["admin_level"="4"]->.ca;
-    area.ca->.searchArea;
+    area(id:{_CALIFORNIA_AREA_ID})->.searchArea;
 
     (
-      node["{tag_key}"~"{value_regex}"](area.searchArea);
-      way ["{tag_key}"~"{value_regex}"](area.searchArea);
-      relation ["{tag_key}"~"{value_regex}"](area.searchArea);
+{statements}
     );
 
     out tags center qt;
     """
 
 
-def call_overpass(query: str) -> Dict:
+# The category set is static, so queries are rendered once at import rather than per request.
+_AREA_TEMPLATES: Dict[str, str] = {
+    category: _area_query_template(spec["key"], spec["values"]) for category, spec in DEFAULT_CATEGORIES.items()
+}
+# Every category in one request: the boundary is resolved once and each element is returned once.
+_CALIFORNIA_ALL_QUERY = _california_query(
+    "\n".join(
+        _union_statements(spec["key"], spec["values"], "(area.searchArea)") for spec in DEFAULT_CATEGORIES.values()
+    )
+)
+# Smaller per-category requests, used when the combined one fails, e.g. with an Overpass
+# runtime error remark after timing out or exceeding maxsize.
+_CALIFORNIA_CATEGORY_QUERIES: Dict[str, str] = {
+    category: _california_query(_union_statements(spec["key"], spec["values"], "(area.searchArea)"))
+    for category, spec in DEFAULT_CATEGORIES.items()
+}
+_CATEGORY_FILTERS: Tuple[Tuple[str, str, FrozenSet[str]], ...] = tuple(
+    (category, spec["key"], frozenset(spec["values"])) for category, spec in DEFAULT_CATEGORIES.items()
+)
+
+
+def build_area_query(category: str, lat: float, lon: float, radius_m: int) -> str:
+    """
+    Build an Overpass QL query for a category scoped to a circular area.
+    """
+    return _AREA_TEMPLATES[category].format(radius_m=radius_m, lat=lat, lon=lon)
+
+
+def _overpass_cache_path(query: str) -> Optional[Path]:
+    """
+    Location of the on-disk cached response for `query`, or None when disk caching is off.
+    """
+    cache_dir = get_settings().overpass_cache_dir
+    if not cache_dir:
+        return None
+    digest = hashlib.sha256(query.encode("utf-8")).hexdigest()
+    return Path(cache_dir) / "overpass" / f"{digest}.json.gz"
+
+
+def _read_cached_overpass(path: Path) -> Optional[Dict]:
+    """
+    Return a cached Overpass payload if the file exists and is within its TTL.
+
+    Aborted responses are never served, even if an older build memoised one.
+    """
+    try:
+        if time.time() - path.stat().st_mtime > get_settings().overpass_cache_ttl_seconds:
+            return None
+        with gzip.open(path, "rb") as handle:
+            payload = orjson.loads(handle.read())
+        if _overpass_runtime_error(payload):
+            return None
+        return payload
+    except FileNotFoundError:
+        return None
+    except Exception:  # noqa: BLE001
+        logger.warning("Ignoring unreadable Overpass cache file %s", path, exc_info=True)
+        return None
+
+
+def _write_cached_overpass(path: Path, content: bytes) -> None:
+    """
+    Atomically store a raw Overpass response body, gzip-compressed.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{get_ident()}.tmp")
+        with gzip.open(tmp_path, "wb", compresslevel=6) as handle:
+            handle.write(content)
+        os.replace(tmp_path, path)
+    except Exception:  # noqa: BLE001
+        logger.warning("Could not write Overpass cache file %s", path, exc_info=True)
+
+
+def call_overpass(query: str, preferred_url: Optional[str] = None, force_refresh: bool = False) -> Dict:
     """
     Attempt the query across the configured mirrors until one responds.
+
+    Mirrors are tried in configured order, starting from `preferred_url` when given
+    so concurrent callers can spread load. Per-mirror retries with backoff are
+    handled by the session's transport adapter. With `overpass_hedge_after_seconds`
+    set, a slow mirror is raced against the next instead of waited out. When
+    `overpass_cache_dir` is set, responses are memoised on disk by query hash;
+    `force_refresh` skips the read but still refreshes the stored copy.
+    """
+    settings = get_settings()
+    cache_path = _overpass_cache_path(query)
+    if cache_path is not None and not force_refresh:
+        cached = _read_cached_overpass(cache_path)
+        if cached is not None:
+            return cached
+
+    urls = list(settings.overpass_urls)
+    if preferred_url in urls:
+        start = urls.index(preferred_url)
+        urls = urls[start:] + urls[:start]
+
+    if settings.overpass_hedge_after_seconds is not None and len(urls) > 1:
+        payload, body = _hedged_overpass(urls, query, settings.overpass_hedge_after_seconds)
+    else:
+        payload, body = _sequential_overpass(urls, query)
+    # Only responses that passed `_post_overpass`'s runtime-error check reach this point.
+    if cache_path is not None:
+        _write_cached_overpass(cache_path, body)
+    return payload
+
+
+def _overpass_runtime_error(payload: Dict) -> Optional[str]:
+    """
+    The `remark` of a response Overpass aborted, e.g. on timeout or maxsize, else None.
+
+    Such responses arrive with HTTP 200 and empty or partial `elements`.
+    """
+    remark = payload.get("remark") or ""
+    return remark if "runtime error" in remark else None
+
+
+def _post_overpass(url: str, query: str, retries: bool = True) -> Tuple[Dict, bytes]:
+    """
+    Run `query` on a single mirror, returning the decoded payload and the raw body.
+    """
+    session = get_session() if retries else get_hedge_session()
+    resp = session.post(url, data={"data": query}, timeout=get_settings().http_timeout)
+    resp.raise_for_status()
+    payload = orjson.loads(resp.content)
+    remark = _overpass_runtime_error(payload)
+    if remark:
+        raise OverpassError(f"Overpass aborted the query on {url}: {remark}")
+    return payload, resp.content
+
+
+def _sequential_overpass(urls: List[str], query: str) -> Tuple[Dict, bytes]:
+    """
+    Try mirrors one after another, returning the first successful response.
+    """
+    last_err: Optional[Exception] = None
+    for url in urls:
+        try:
+            return _post_overpass(url, query)
+        except Exception as exc:  # noqa: BLE001
+            last_err = exc
+    raise OverpassError(f"Overpass failed on all mirrors: {last_err}")
+
+
+@lru_cache
+def _hedge_pool() -> ThreadPoolExecutor:
+    """
+    Return the process-wide pool for hedged Overpass attempts.
+
+    Every category call, plus a statewide export's per-category fallback queries,
+    may race all mirrors at once.
     """
     settings = get_settings()
+    workers = (settings.category_pool_size + len(DEFAULT_CATEGORIES)) * max(1, len(settings.overpass_urls))
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="overpass-hedge")
+    atexit.register(pool.shutdown)
+    return pool
+
+
+def _hedged_overpass(urls: List[str], query: str, hedge_after: float) -> Tuple[Dict, bytes]:
+    """
+    Race mirrors with staggered starts, returning the first successful response.
+
+    The next mirror is started once every running request has been silent for
+    `hedge_after` seconds, or straight away when they have all failed. Attempts
+    skip the transport retries, so a request still in flight when another
+    succeeds ends within one `http_timeout` rather than a full retry cycle.
+    """
+    pool = _hedge_pool()
+    remaining = iter(urls)
+    next_url = next(remaining, None)
+    pending: Set[Future] = set()
     last_err: Optional[Exception] = None
-    for url in settings.overpass_urls:
-        for attempt in range(1, settings.overpass_retry_attempts + 1):
-            try:
-                resp = requests.post(url, data={"data": query}, timeout=settings.http_timeout)
-                if resp.status_code == 429:
-                    time.sleep(5)
-                    continue
-                resp.raise_for_status()
-                return resp.json()
-            except Exception as exc:  # noqa: BLE001
-                last_err = exc
-                backoff = min(5, attempt * 2)
-                time.sleep(backoff)
+    start_next = True
+    try:
+        while True:
+            if start_next and next_url is not None:
+                pending.add(pool.submit(_post_overpass, next_url, query, False))
+                next_url = next(remaining, None)
+            if not pending:
+                break
+            done, pending = wait(
+                pending,
+                timeout=hedge_after if next_url is not None else None,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                try:
+                    return future.result()
+                except Exception as exc:  # noqa: BLE001
+                    last_err = exc
+            # Hedge only after a silent window, or once every running attempt has failed.
+            start_next = not done or not pending
+    finally:
+        for future in pending:
+            future.cancel()
     raise OverpassError(f"Overpass failed on all mirrors: {last_err}")
 
 
+def _spread_mirror(index: int) -> Optional[str]:
+    """
+    Mirror to start the `index`-th of several concurrent queries on, so they do not all hit one server.
+    """
+    mirrors = get_settings().overpass_urls
+    return mirrors[index % len(mirrors)] if mirrors else None
+
+
+_ADDRESS_KEYS = ("addr:housenumber", "addr:street", "addr:city", "addr:postcode", "addr:state")
+
+
 def normalize_record(el: Dict, category: str) -> Dict:
     """
     Convert Overpass elements into a consistent response dictionary.
     """
+    record = _normalize_fields(el, category)
+    record["source_tags"] = _serialize_tags(el)
+    return record
+
+
+def _serialize_tags(el: Dict) -> str:
+    """
+    JSON-encode an element's raw tags for the `source_tags` field.
+    """
+    return orjson.dumps(el.get("tags", {}) or {}).decode("utf-8")
+
+
+def _normalize_fields(el: Dict, category: str) -> Dict:
+    """
+    Every normalised field except `source_tags`, which pipelines serialise only for
+    records that survive filtering and dedupe.
+    """
     tags = el.get("tags", {}) or {}
 
     phone = tags.get("contact:phone") or tags.get("phone")
@@ -111,13 +372,7 @@ def normalize_record(el: Dict, category: str) -> Dict:
     except (TypeError, ValueError):
         lat, lon = None, None
 
-    addr = ", ".join(
-        [
-            tags.get(k)
-            for k in ["addr:housenumber", "addr:street", "addr:city", "addr:postcode", "addr:state"]
-            if tags.get(k)
-        ]
-    ).strip(", ")
+    addr = ", ".join([value for k in _ADDRESS_KEYS if (value := tags.get(k))]).strip(", ")
 
     name = tags.get("name")
 
@@ -131,13 +386,98 @@ def normalize_record(el: Dict, category: str) -> Dict:
         "address": addr,
         "lat": lat,
         "lon": lon,
-        "source_tags": json.dumps(tags, ensure_ascii=False),
     }
 
 
+def _match_email(text: str) -> Optional[Match[str]]:
+    """
+    First `EMAIL_REGEX` match in `text`, scanning only around `@` characters.
+
+    Running `EMAIL_REGEX` over a whole page retries the local-part class at every
+    offset, which degrades badly on long alphanumeric runs such as inline scripts.
+    Every match contains an `@`, so the regex is confined to a short window around
+    each one instead, and only after the domain half has matched once at that `@`:
+    most `@`s in markup (`@media`, handles) fail there without the local part being
+    retried from every offset in the window.
+    """
+    at = text.find("@")
+    while at != -1:
+        if not _EMAIL_DOMAIN_AT.match(text, at, at + _EMAIL_DOMAIN_MAX + 1):
+            at = text.find("@", at + 1)
+            continue
+        match = EMAIL_REGEX.search(text, max(0, at - _EMAIL_LOCAL_MAX), at + _EMAIL_DOMAIN_MAX + 1)
+        if match:
+            return match
+        at = text.find("@", at + 1)
+    return None
+
+
+def find_email(text: str) -> Optional[str]:
+    """
+    Return the first email address in `text`.
+    """
+    match = _match_email(text)
+    return match.group(0) if match else None
+
+
+def _find_email_in_chunks(chunks: Iterable[str], max_chars: int) -> Optional[str]:
+    """
+    Return the first email across streamed text chunks, reading at most `max_chars`.
+
+    A tail long enough to hold any match is carried between chunks so addresses
+    split across a boundary are still found. While only domain characters follow a
+    match, more text could still change it, so it is only accepted once a character
+    outside the domain class confirms where it ends.
+    """
+    tail = ""
+    consumed = 0
+    for chunk in chunks:
+        window = tail + chunk
+        match = _match_email(window)
+        tail_start = max(0, len(window) - _EMAIL_MATCH_MAX)
+        if match:
+            if not _OPEN_DOMAIN_TAIL.match(window, match.end()):
+                return match.group(0)
+            tail_start = min(tail_start, match.start())
+        tail = window[tail_start:]
+        consumed += len(chunk)
+        if consumed >= max_chars:
+            break
+    return find_email(tail)
+
+
+def _is_textual(content_type: str) -> bool:
+    """
+    Whether a Content-Type header could carry an HTML or text page worth scanning.
+    """
+    if not content_type:
+        return True
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith("text/") or media_type.endswith(("+xml", "/xml"))
+
+
+def _wait_for_host_slot(host: str, interval: float) -> None:
+    """
+    Block until `host` may be requested again, spacing hits to one host by `interval` seconds.
+    """
+    if interval <= 0:
+        return
+    with _HOST_SLOT_LOCK:
+        now = time.monotonic()
+        if len(_HOST_NEXT_SLOT) >= _HOST_SLOT_PRUNE_AT:
+            for stale in [h for h, slot in _HOST_NEXT_SLOT.items() if slot <= now]:
+                del _HOST_NEXT_SLOT[stale]
+        slot = max(now, _HOST_NEXT_SLOT.get(host, 0.0))
+        _HOST_NEXT_SLOT[host] = slot + interval
+    if slot > now:
+        time.sleep(slot - now)
+
+
 def try_discover_email_from_site(url: str) -> Optional[str]:
     """
     Fetch the homepage and well-known contact paths looking for an email address.
+
+    Politeness delays are per host, so crawls of different sites never wait on each other.
     """
     settings = get_settings()
     if not url or not isinstance(url, str):
@@ -145,65 +485,148 @@ def try_discover_email_from_site(url: str) -> Optional[str]:
     if not url.startswith(("http://", "https://")):
         url = "http://" + url
 
-    try:
-        from urllib.parse import urljoin
-    except ImportError:  # pragma: no cover
-        urljoin = None
-
-    candidates = [url]
-    if urljoin:
-        candidates.append(urljoin(url, "/contact"))
-        candidates.append(urljoin(url, "/contact-us"))
+    parsed = urlparse(url)
+    host = parsed.netloc.lower().removeprefix("www.")
+    if host in _NO_EMAIL_HOSTS or host.partition(".")[2] in _NO_EMAIL_HOSTS:
+        return None
+    if parsed.path.lower().endswith(_NON_HTML_SUFFIXES):
+        return None
 
-    headers = {"User-Agent": settings.user_agent}
+    candidates = [url, *(urljoin(url, path) for path in _CONTACT_PATHS)]
 
+    session = get_session()
     for candidate in candidates:
+        _wait_for_host_slot(_website_host(candidate), settings.crawl_sleep_seconds)
         try:
-            resp = requests.get(candidate, headers=headers, timeout=settings.http_timeout)
-            if resp.status_code >= 400:
-                continue
-            match = EMAIL_REGEX.search(resp.text or "")
-            if match:
-                found = match.group(0)
-                if not any(bad in found.lower() for bad in ["example.com", "email@", "your@", "info@example"]):
+            with session.get(candidate, timeout=settings.http_timeout, stream=True) as resp:
+                if resp.status_code >= 400:
+                    continue
+                if not _is_textual(resp.headers.get("content-type", "")):
+                    found = None
+                else:
+                    resp.encoding = resp.encoding or "utf-8"
+                    chunks = resp.iter_content(chunk_size=16384, decode_unicode=True)
+                    found = _find_email_in_chunks(chunks, _MAX_PAGE_CHARS)
+            if found:
+                if not any(bad in found.lower() for bad in _PLACEHOLDER_EMAIL_MARKERS):
                     return found
         except Exception:  # noqa: BLE001
             pass
-        time.sleep(settings.crawl_sleep_seconds)
     return None
 
 
-def dedupe(records: List[Dict]) -> List[Dict]:
+def fixed_point(value: float, scale: int = COORD_SCALE) -> int:
+    """
+    Quantise a coordinate to an integer with `scale` steps per degree; ints hash faster than floats.
+    """
+    return round(value * scale)
+
+
+def _dedupe_key(name: Optional[str], lat: float, lon: float) -> Tuple[Optional[str], int, int]:
+    """
+    Identity used to collapse duplicate places: name plus fixed-point coordinates.
+    """
+    return (name, fixed_point(lat), fixed_point(lon))
+
+
+def _unique_within_radius(records: Iterable[Dict], lat: float, lon: float, max_distance_m: float) -> List[Dict]:
     """
-    Deduplicate records by (name, rounded lat/lon).
+    Keep the first record per dedupe key among those within `max_distance_m` of the centre.
+
+    Distance filtering and deduplication share one pass so each record's fields are
+    read once. A lat/lon bounding box around the centre rejects distant records
+    with plain comparisons. Remaining candidates compare the haversine term `a`
+    against its precomputed threshold, using the centre's cosine computed once,
+    so neither `sqrt` nor `asin` runs per record.
     """
-    seen = set()
-    out: List[Dict] = []
+    angular_distance = max_distance_m / EARTH_RADIUS_M
+    lat_delta = degrees(angular_distance)
+    if angular_distance < pi / 2 - abs(radians(lat)):
+        lon_delta = degrees(asin(sin(angular_distance) / cos(radians(lat))))
+    else:
+        lon_delta = 180.0  # The circle reaches a pole; every longitude is a candidate.
+
+    # distance <= max  <=>  a <= sin^2(max / 2R), as asin(sqrt(a)) is monotonic on [0, 1].
+    max_a = sin(min(angular_distance / 2, pi / 2)) ** 2
+    centre_phi = radians(lat)
+    centre_cos = cos(centre_phi)
+
+    seen: Set[Tuple[Optional[str], int, int]] = set()
+    filtered: List[Dict] = []
     for rec in records:
-        key = (
-            rec.get("name"),
-            round(float(rec.get("lat") or 0), 6),
-            round(float(rec.get("lon") or 0), 6),
-        )
+        rec_lat = rec.get("lat")
+        rec_lon = rec.get("lon")
+        if rec_lat is None or rec_lon is None:
+            continue
+        rec_lat = float(rec_lat)
+        rec_lon = float(rec_lon)
+        if abs(rec_lat - lat) > lat_delta:
+            continue
+        lon_diff = abs(rec_lon - lon) % 360
+        if min(lon_diff, 360 - lon_diff) > lon_delta:
+            continue
+        rec_phi = radians(rec_lat)
+        a = sin((rec_phi - centre_phi) / 2) ** 2 + centre_cos * cos(rec_phi) * sin(radians(rec_lon - lon) / 2) ** 2
+        if a > max_a:
+            continue
+        key = _dedupe_key(rec.get("name"), rec_lat, rec_lon)
         if key in seen:
             continue
         seen.add(key)
-        out.append(rec)
-    return out
+        filtered.append(rec)
+    return filtered
 
 
-def _haversine_distance_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+def _website_host(url: str) -> str:
     """
-    Great-circle distance between two coordinates in metres.
+    Lower-cased host of a website tag without a leading `www.`, tolerating values without a scheme.
+    """
+    if not url.startswith(("http://", "https://")):
+        url = "http://" + url
+    return urlparse(url).netloc.lower().removeprefix("www.")
+
+
+def _enrich_missing_emails(records: List[Dict]) -> None:
+    """
+    Fill missing emails in place from each record's website, crawling distinct hosts concurrently.
+
+    Chains often share one website, so each host is crawled once and the result is
+    fanned back out to every record pointing at it. A host therefore only ever sees
+    one crawler, and `try_discover_email_from_site` keeps its politeness delay.
+    """
+    settings = get_settings()
+    by_host: Dict[str, List[Dict]] = {}
+    for record in records:
+        if not record.get("email") and record.get("website"):
+            by_host.setdefault(_website_host(record["website"]), []).append(record)
+    if not by_host:
+        return
+
+    def _discover(host_records: List[Dict]) -> Optional[str]:
+        return try_discover_email_from_site(host_records[0]["website"])
+
+    groups = list(by_host.values())
+    max_workers = min(settings.email_discovery_concurrency, len(groups))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="email-discovery") as executor:
+        for host_records, email in zip(groups, executor.map(_discover, groups)):
+            if email:
+                for record in host_records:
+                    record["email"] = email
+
+
+@lru_cache
+def _category_pool() -> ThreadPoolExecutor:
     """
-    radius_m = 6371000  # Mean Earth radius in metres.
-    phi1, phi2 = radians(lat1), radians(lat2)
-    d_phi = radians(lat2 - lat1)
-    d_lambda = radians(lon2 - lon1)
+    Return the process-wide pool for per-category Overpass calls.
 
-    a = sin(d_phi / 2) ** 2 + cos(phi1) * cos(phi2) * sin(d_lambda / 2) ** 2
-    c = 2 * atan2(sqrt(a), sqrt(1 - a))
-    return radius_m * c
+    Sharing one pool avoids spawning threads per request. It is sized by
+    `category_pool_size` for all concurrent searches, while each search keeps at
+    most `max_parallel_category_requests` of its own calls in flight.
+    """
+    settings = get_settings()
+    pool = ThreadPoolExecutor(max_workers=settings.category_pool_size, thread_name_prefix="overpass-category")
+    atexit.register(pool.shutdown)
+    return pool
 
 
 def fetch_places(
@@ -221,13 +644,14 @@ def fetch_places(
     if not categories:
         return []
 
-    def _fetch_category(category: str) -> List[Dict]:
-        spec = DEFAULT_CATEGORIES[category]
-        query = build_area_query(lat, lon, radius_m, spec["key"], spec["values"])
-        data = call_overpass(query)
+    def _fetch_category(category: str, preferred_url: Optional[str]) -> List[Dict]:
+        query = build_area_query(category, lat, lon, radius_m)
+        data = call_overpass(query, preferred_url=preferred_url)
         elements = data.get("elements", [])
         category_records: List[Dict] = []
         for element in elements:
+            if not (element.get("tags") or {}).get("name"):
+                continue  # Unnamed features are dropped anyway; skip normalising them.
             rec = normalize_record(element, category)
             if rec["name"] and rec["lat"] is not None and rec["lon"] is not None:
                 category_records.append(rec)
@@ -236,10 +660,19 @@ def fetch_places(
     records: List[Dict] = []
     errors: List[Exception] = []
 
-    max_workers = min(settings.max_parallel_category_requests, len(categories))
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(_fetch_category, category): category for category in categories}
-        for future in as_completed(futures):
+    pool = _category_pool()
+    queued = iter(enumerate(categories))
+    pending: Set[Future] = set()
+    while True:
+        # Top up this search's window of in-flight calls as earlier ones finish.
+        for idx, category in queued:
+            pending.add(pool.submit(_fetch_category, category, _spread_mirror(idx)))
+            if len(pending) >= settings.max_parallel_category_requests:
+                break
+        if not pending:
+            break
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
             try:
                 records.extend(future.result())
             except Exception as exc:  # noqa: BLE001
@@ -251,64 +684,56 @@ def fetch_places(
             raise first_error
         raise OverpassError(f"Failed to fetch places: {first_error}") from first_error
 
-    tolerance = settings.distance_tolerance_factor
-    filtered_records = [
-        rec
-        for rec in records
-        if rec.get("lat") is not None
-        and rec.get("lon") is not None
-        and _haversine_distance_m(lat, lon, float(rec["lat"]), float(rec["lon"])) <= radius_m * tolerance
-    ]
-
-    records = dedupe(filtered_records)
+    records = _unique_within_radius(records, lat, lon, radius_m * settings.distance_tolerance_factor)
 
     if enable_email_discovery and settings.enable_website_email_discovery:
-        to_enrich = [record for record in records if not record.get("email") and record.get("website")]
-        for idx, record in enumerate(to_enrich, start=1):
-            email = try_discover_email_from_site(record["website"])
-            if email:
-                record["email"] = email
-            if idx % 25 == 0:
-                time.sleep(settings.crawl_sleep_seconds)
+        _enrich_missing_emails(records)
 
     return records
 
 
-def load_mock_places() -> List[Dict]:
+def _read_mock_places() -> List[Dict]:
     """
-    Load static places from disk for development/demo fallbacks.
+    Parse the configured mock places file, returning an empty list when unusable.
     """
-    global _MOCK_CACHE
-    if _MOCK_CACHE is not None:
-        return _MOCK_CACHE
-
     settings = get_settings()
     path = settings.mock_places_path
     if not path:
-        _MOCK_CACHE = []
-        return _MOCK_CACHE
+        return []
 
     candidate = Path(path)
     if not candidate.is_absolute():
         candidate = Path(__file__).resolve().parent.parent / path
 
     if not candidate.exists():
-        _MOCK_CACHE = []
-        return _MOCK_CACHE
+        return []
 
     try:
-        with candidate.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-            if isinstance(data, list):
-                _MOCK_CACHE = data
-            else:
-                _MOCK_CACHE = []
+        data = orjson.loads(candidate.read_bytes())
     except Exception:  # noqa: BLE001
-        _MOCK_CACHE = []
+        return []
+    return data if isinstance(data, list) else []
+
+
+def load_mock_places() -> Tuple[Mapping[str, Any], ...]:
+    """
+    Load static places from disk for development/demo fallbacks.
+
+    The file is read once; concurrent first callers wait on a lock rather than
+    each parsing it. The shared copy is a tuple of read-only record views, so
+    callers can mutate neither the sequence nor the records in it.
+    """
+    global _MOCK_CACHE
+    if _MOCK_CACHE is not None:
+        return _MOCK_CACHE
+
+    with _MOCK_LOCK:
+        if _MOCK_CACHE is None:
+            _MOCK_CACHE = tuple(MappingProxyType(record) for record in _read_mock_places())
     return _MOCK_CACHE
 
 
-def get_mock_places(categories: Optional[List[str]] = None) -> List[Dict]:
+def get_mock_places(categories: Optional[List[str]] = None) -> List[Mapping[str, Any]]:
     """
     Return mock places filtered by category if provided.
     """
@@ -316,57 +741,99 @@ def get_mock_places(categories: Optional[List[str]] = None) -> List[Dict]:
     if not data:
         return []
     if not categories:
-        return data
+        return list(data)
     return [record for record in data if record.get("category") in categories]
 
 
-def _collect_california_category_records(category: str, spec: Dict[str, object]) -> List[Dict]:
+def _california_elements_by_category() -> Dict[str, Deque[Dict]]:
     """
-    Fetch raw records for a single category across California.
+    Fetch named elements for every default category across California in one Overpass request.
+
+    The combined response is routed back to categories by the same exact tag
+    filters the query used, so an element matching several categories is listed
+    under each of them, as it would be with one request per category. If the
+    combined request fails, each category is fetched on its own instead.
     """
-    query = build_california_query(spec["key"], spec["values"])  # type: ignore[index]
-    data = call_overpass(query)
-    elements = data.get("elements", [])
-    records: List[Dict] = []
-    for element in elements:
-        records.append(normalize_record(element, category))
-    return records
+    try:
+        data = call_overpass(_CALIFORNIA_ALL_QUERY)
+    except OverpassError as exc:
+        logger.warning("Combined California query failed, retrying per category: %s", exc)
+        return _california_elements_per_category()
+
+    by_category: Dict[str, Deque[Dict]] = {category: deque() for category, _, _ in _CATEGORY_FILTERS}
+    for element in data.get("elements", []):
+        tags = element.get("tags") or {}
+        if not tags.get("name"):
+            continue
+        for category, tag_key, tag_values in _CATEGORY_FILTERS:
+            if tags.get(tag_key) in tag_values:
+                by_category[category].append(element)
+    return by_category
 
 
-def _filter_valid_records(records: Iterable[Dict]) -> List[Dict]:
+def _california_elements_per_category() -> Dict[str, Deque[Dict]]:
     """
-    Retain only records that have a name and concrete coordinates.
+    Fetch named elements across California with one concurrent Overpass request per category.
     """
-    filtered: List[Dict] = []
-    for record in records:
-        name = record.get("name")
-        lat = record.get("lat")
-        lon = record.get("lon")
-        if name and lat is not None and lon is not None:
-            filtered.append(record)
-    return filtered
+    categories = list(_CALIFORNIA_CATEGORY_QUERIES)
+    # Statewide queries can run for minutes, so they get their own pool rather than
+    # occupying the shared per-search category pool.
+    executor = ThreadPoolExecutor(max_workers=len(categories), thread_name_prefix="overpass-california")
+    try:
+        futures = [
+            executor.submit(call_overpass, _CALIFORNIA_CATEGORY_QUERIES[category], _spread_mirror(idx))
+            for idx, category in enumerate(categories)
+        ]
+        return {
+            category: deque(
+                element
+                for element in future.result().get("elements", [])
+                if (element.get("tags") or {}).get("name")
+            )
+            for category, future in zip(categories, futures)
+        }
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def fetch_california_places() -> Iterator[Dict]:
+    """
+    Lazily yield valid, deduplicated places for each default category across California.
+
+    All categories are fetched with a single Overpass request where possible.
+    Elements are normalised, filtered and deduplicated category by category, and
+    tags are only serialised for records that are actually yielded. Each raw
+    element is dropped as soon as it has been consumed, so the parsed response
+    shrinks as the export streams instead of being held until the last row.
+    """
+    by_category = _california_elements_by_category()
+    seen: Set[Tuple[Optional[str], int, int]] = set()
+    for category, elements in by_category.items():
+        while elements:
+            element = elements.popleft()
+            record = _normalize_fields(element, category)
+            lat, lon = record["lat"], record["lon"]
+            if lat is None or lon is None:
+                continue
+            key = _dedupe_key(record["name"], lat, lon)
+            if key in seen:
+                continue
+            seen.add(key)
+            record["source_tags"] = _serialize_tags(element)
+            yield record
 
 
-def fetch_california_places(enable_email_discovery: bool = False) -> List[Dict]:
+def fetch_california_places_with_emails() -> List[Dict]:
     """
-    Fetch places for each default category across the state of California.
+    Materialise the California places and enrich missing emails from their websites.
+
+    Enrichment needs a second pass over the full result set, so this entry point
+    cannot stream; use `fetch_california_places` when emails are not required.
     """
     settings = get_settings()
+    records = list(fetch_california_places())
 
-    raw_records: List[Dict] = []
-    for category, spec in DEFAULT_CATEGORIES.items():
-        raw_records.extend(_collect_california_category_records(category, spec))
-
-    records = _filter_valid_records(raw_records)
-    records = dedupe(records)
-
-    if enable_email_discovery and settings.enable_website_email_discovery:
-        to_enrich = [record for record in records if not record.get("email") and record.get("website")]
-        for idx, record in enumerate(to_enrich, start=1):
-            email = try_discover_email_from_site(record["website"])
-            if email:
-                record["email"] = email
-            if idx % 25 == 0:
-                time.sleep(settings.crawl_sleep_seconds)
+    if settings.enable_website_email_discovery:
+        _enrich_missing_emails(records)
 
     return records